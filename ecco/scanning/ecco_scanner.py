@@ -1,9 +1,23 @@
-from typing import TextIO, List
+from typing import TextIO, Dict, Match, Optional
 import os
+import re
 
 from ..utils.ecco_logging import EccoFileNotFound, EccoSyntaxError
 from .ecco_token import Token, TokenType
 
+# Source programs are ASCII, so character classes are spelled out
+# explicitly rather than going through the Unicode-aware str methods
+_DIGITS = frozenset("0123456789")
+_WHITESPACE = frozenset(" \t\n\r\f\v")
+
+_INTEGER_LITERAL_RE = re.compile(r"[0-9]*")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r\f\v]*")
+
+# Token types spelled as a single character, keyed by that character
+_SINGLE_CHARACTER_TOKENS: Dict[str, TokenType] = {
+    str(token_type): token_type for token_type in TokenType if len(str(token_type)) == 1
+}
+
 
 class Scanner:
     def __init__(self, input_fn: str):
@@ -15,7 +29,10 @@ class Scanner:
         self.filename: str = input_fn
         self.file: TextIO
 
-        self.put_back_buffer: str = ""
+        # The full program source and our current read position in it
+        self._src: str = ""
+        self._src_length: int = 0
+        self._pos: int = 0
 
         self.line_number: int = 1
 
@@ -33,6 +50,10 @@ class Scanner:
         else:
             raise EccoFileNotFound(self.filename)
 
+        self._src = self.file.read()
+        self._src_length = len(self._src)
+        self._pos = 0
+
         self.initialized = True
 
         return self
@@ -49,18 +70,14 @@ class Scanner:
         """
         c: str = ""
 
-        # If we have a character in the putback buffer,
-        # we want to read that first, then empty the
-        # buffer
-        if self.put_back_buffer:
-            c = self.put_back_buffer
-            self.put_back_buffer = ""
+        # Read a single character from the source
+        # buffer, and conditionally increment our
+        # rudimentary line counter
+        if self._pos >= self._src_length:
             return c
 
-        # Otherwise, we read a single character from
-        # the open input file, and conditionally
-        # increment our rudimentary line counter
-        c = self.file.read(1)
+        c = self._src[self._pos]
+        self._pos += 1
         if c == "\n":
             self.line_number += 1
 
@@ -73,22 +90,20 @@ class Scanner:
             str: The next non-whitespace character from the input stream
         """
         c: str = self.next_character()
-        while c.isspace():
-            c = self.next_character()
-        return c
+        if c not in _WHITESPACE:
+            return c
 
-    def put_back(self, c: str) -> None:
-        """Put a character back into the input stream
+        # Most runs are a single character, so only jump over the
+        # rest of the run when there is one, counting any newlines
+        # we pass for the line counter
+        if self._pos < self._src_length and self._src[self._pos] in _WHITESPACE:
+            match: Optional[Match[str]] = _WHITESPACE_RE.match(self._src, self._pos)
+            assert match is not None
 
-        Args:
-            c (str): Character to put back into the input stream
-        """
-        if len(c) != 1:
-            raise TypeError(
-                f"put_back() expected a character, but string of length {len(c)} found"
-            )
+            self.line_number += self._src.count("\n", self._pos, match.end())
+            self._pos = match.end()
 
-        self.put_back_buffer = c
+        return self.next_character()
 
     def scan_integer_literal(self, c: str) -> int:
         """Scan integer literals into a buffer and parse them into int objects
@@ -99,15 +114,15 @@ class Scanner:
         Returns:
             int: Scanned integer literal
         """
-        in_string: str = ""
+        # Match the rest of the literal directly against the
+        # source buffer rather than reading it character by
+        # character; the terminating character is left unread
+        match: Optional[Match[str]] = _INTEGER_LITERAL_RE.match(self._src, self._pos)
+        assert match is not None
 
-        while c.isdigit():
-            in_string += c
-            c = self.next_character()
+        self._pos = match.end()
 
-        self.put_back(c)
-
-        return int(in_string)
+        return int(c + match.group())
 
     def scan(self, current_token: Token) -> bool:
         """Scan the next token
@@ -127,23 +142,20 @@ class Scanner:
         if c == "":
             return False
 
-        possible_token_types: List[TokenType] = []
-        for token_type in TokenType:
-            if str(token_type)[0] == c:
-                possible_token_types.append(token_type)
+        token_type: Optional[TokenType] = _SINGLE_CHARACTER_TOKENS.get(c)
 
-        if not len(possible_token_types):
-            if c.isdigit():
+        if token_type is None:
+            if c in _DIGITS:
                 current_token.type = TokenType.INTEGER_LITERAL
                 current_token.value = self.scan_integer_literal(c)
             else:
-                raise EccoSyntaxError(f'Uncrecognized token "{c}"')
+                # Non-ASCII and unprintable characters (e.g. a
+                # non-breaking space) are shown by code point
+                if ord(c) < 128 and c.isprintable():
+                    raise EccoSyntaxError(f'Uncrecognized token "{c}"')
+                raise EccoSyntaxError(f"Uncrecognized token U+{ord(c):04X}")
         else:
-            if len(c) == 1:
-                current_token.type = possible_token_types[0]
-                return True
-            else:
-                pass
+            current_token.type = token_type
 
         return True
 
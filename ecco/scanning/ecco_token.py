@@ -22,6 +22,8 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ("type", "value")
+
     def __init__(self, _type: TokenType = TokenType.UNKNOWN_TOKEN, _value: int = 0):
         """Stores Token data
 